@@ -31,6 +31,7 @@ from flopy.modflow import (
 from flopy.mt3d import Mt3dBtn, Mt3dms
 from flopy.seawat import Seawat
 from flopy.utils import Util2d
+from flopy.utils.mfreadnam import attribs_from_namfile_header
 
 
 @pytest.fixture
@@ -466,6 +467,47 @@ def test_namfile_readwrite(tmpdir, example_data_path):
     assert ml.modelgrid.angrot == 15.0
 
 
+def test_attribs_from_namfile_header(tmpdir):
+    namfile = tmpdir / "header.nam"
+    with open(namfile, "w") as f:
+        f.write("# Name file for MODFLOW-2005, generated by Flopy.\n")
+        f.write(
+            "#xul:619653; yul:3353277; rotation:15; "
+            "proj4_str:+proj=utm +zone=14 +ellps=WGS84 +units=m; "
+            "units:meters; lenuni:2; start_datetime:1-1-1970\n"
+        )
+        f.write("#xll:bad; proj4_str:none\n")
+        f.write("LIST 2 header.list\n")
+        f.write("#xll:1.0\n")
+
+    attribs = attribs_from_namfile_header(str(namfile))
+    assert attribs["xul"] == 619653.0
+    assert attribs["yul"] == 3353277.0
+    assert attribs["rotation"] == 15.0
+    assert attribs["proj4_str"] is None
+    assert attribs["start_datetime"] == "1-1-1970"
+    # unparsable values and lines after the header are ignored
+    assert attribs["xll"] is None
+    assert attribs["yll"] is None
+
+
+def test_attribs_from_namfile_header_modified(tmpdir):
+    namfile = tmpdir / "header.nam"
+    with open(namfile, "w") as f:
+        f.write("#xll:1.0; rotation:15\n")
+    assert attribs_from_namfile_header(str(namfile))["xll"] == 1.0
+
+    # header is read again after the name file changes
+    with open(namfile, "w") as f:
+        f.write("#xll:12.0; rotation:15\n")
+    attribs = attribs_from_namfile_header(str(namfile))
+    assert attribs["xll"] == 12.0
+
+    # returned attributes are independent of previous calls
+    attribs["rotation"] = 0.0
+    assert attribs_from_namfile_header(str(namfile))["rotation"] == 15.0
+
+
 def test_read_usgs_model_reference(tmpdir, model_reference_path):
     nlay, nrow, ncol = 1, 30, 5
     delr, delc = 250, 500
@@ -537,6 +579,26 @@ def test_read_usgs_model_reference(tmpdir, model_reference_path):
             os.remove(os.path.join(f))
 
 
+def test_read_usgs_model_reference_modified(tmpdir):
+    reffile = tmpdir / "usgs.model.reference"
+    with open(reffile, "w") as f:
+        f.write("xll 100.0\nyll 200.0\nrotation 10.0\nepsg 102733\n")
+    mg = StructuredGrid(delr=np.ones(3), delc=np.ones(2))
+    assert mg.read_usgs_model_reference_file(str(reffile))
+    assert mg.xoffset == 100.0
+    assert mg.epsg == 102733
+
+    # reference file is read again after it changes
+    with open(reffile, "w") as f:
+        f.write("xll 150.0\nyll 200.0\nrotation 10.0\nepsg 4326\n")
+    mg = StructuredGrid(delr=np.ones(3), delc=np.ones(2))
+    assert mg.read_usgs_model_reference_file(str(reffile))
+    assert mg.xoffset == 150.0
+    assert mg.yoffset == 200.0
+    assert mg.angrot == 10.0
+    assert mg.epsg == 4326
+
+
 def mf2005_model_namfiles():
     path = get_example_data_path() / "mf2005_test"
     return [str(p) for p in path.glob("*.nam")]
@@ -1,6 +1,8 @@
 import numpy as np
 
+from flopy.discretization.modeltime import ModelTime
 from flopy.modflow import Modflow, ModflowDis
+from flopy.utils.reference import TemporalReference
 
 
 def test_dis_sr():
@@ -32,3 +34,97 @@ def test_dis_sr():
     x, y = bg.modelgrid.get_coords(0, delc * nrow)
     np.testing.assert_almost_equal(x, xul)
     np.testing.assert_almost_equal(y, yul)
+
+
+def test_dis_modeltime_totim():
+    perlen = [1.0, 10.0, 100.0, 365.25]
+    nstp = [1, 5, 10, 7]
+    tsmult = [1.0, 1.0, 1.2, 0.8]
+    ml = Modflow(modelname="totim")
+    ModflowDis(
+        ml,
+        nper=len(perlen),
+        perlen=perlen,
+        nstp=nstp,
+        tsmult=tsmult,
+    )
+
+    # build expected time steps one at a time
+    delt = []
+    for per, n, mult in zip(perlen, nstp, tsmult):
+        if mult != 1.0:
+            dt = per * (mult - 1) / (mult**n - 1)
+        else:
+            dt = per / n
+        for _ in range(n):
+            delt.append(dt)
+            dt *= mult
+
+    totim = ml.modeltime.totim
+    assert totim.shape == (sum(nstp),)
+    # dis stores tsmult as float32
+    np.testing.assert_allclose(totim, np.cumsum(delt), rtol=1e-6)
+    np.testing.assert_allclose(totim[-1], sum(perlen), rtol=1e-6)
+    np.testing.assert_allclose(ml.modeltime.tslen, delt, rtol=1e-6)
+
+
+def test_modeltime_cache():
+    period_data = {
+        "perlen": np.array([10.0, 20.0]),
+        "nstp": np.array([2, 4]),
+        "tsmult": np.array([1.0, 1.5]),
+    }
+    mt = ModelTime(period_data)
+    totim = mt.totim
+    tslen = mt.tslen
+
+    # returned arrays are copies of the cached results
+    totim[:] = 0.0
+    tslen[:] = 0.0
+    np.testing.assert_allclose(mt.totim[-1], 30.0)
+    np.testing.assert_allclose(mt.tslen.sum(), 30.0)
+
+    # replacing a period data array invalidates the cache
+    period_data["perlen"] = np.array([10.0, 40.0])
+    np.testing.assert_allclose(mt.totim[-1], 50.0)
+    np.testing.assert_allclose(mt.tslen.sum(), 50.0)
+
+    # replaced arrays are detected even if a new array reuses the id of
+    # an array that has been freed
+    period_data["perlen"] = np.array([1.0, 1.0])
+    period_data["perlen"] = np.array([100.0, 100.0])
+    np.testing.assert_allclose(mt.totim[-1], 200.0)
+    np.testing.assert_allclose(mt.tslen.sum(), 200.0)
+
+    # edits made in place invalidate the cache
+    mt.perlen[0] = 1000.0
+    np.testing.assert_allclose(mt.totim[-1], 1100.0)
+    np.testing.assert_allclose(mt.tslen.sum(), 1100.0)
+
+
+def test_modeltime_period_data_lists():
+    mt = ModelTime({"perlen": [1.0, 2.0], "nstp": [1, 2], "tsmult": [1, 1]})
+    assert isinstance(mt.perlen, np.ndarray)
+    assert mt.nstp.dtype.kind == "i"
+    assert mt.tsmult.dtype == np.float64
+    assert mt.perlen is mt.perlen
+    np.testing.assert_allclose(mt.totim, [1.0, 2.0, 3.0])
+
+    # arrays of other dtypes are converted once as well
+    mt = ModelTime(
+        {
+            "perlen": np.array([1.0, 2.0], dtype=np.float32),
+            "nstp": np.array([1, 2], dtype=np.int32),
+            "tsmult": np.array([1.0, 1.0], dtype=np.float32),
+        }
+    )
+    assert mt.perlen.dtype == np.float64
+    assert mt.tsmult.dtype == np.float64
+    assert mt.nstp.dtype == np.dtype(int)
+    assert mt.perlen is mt.perlen
+
+
+def test_temporal_reference_time_units():
+    assert TemporalReference(itmuni=1).model_time_units == "seconds"
+    assert TemporalReference(itmuni=5).model_time_units == "years"
+    assert TemporalReference(itmuni=4.0).model_time_units == "days"
@@ -6,6 +6,35 @@ import numpy as np
 from ..plot.plotutil import UnstructuredPlotUtilities
 from ..utils import geometry
 from ..utils.gridutil import get_lni
+from ..utils.mfreadnam import _read_cached, _read_namfile_header
+
+# entries read from a usgs.model.reference file, and how to cast their values
+_USGS_REF_CASTER = {
+    "xll": float,
+    "yll": float,
+    "xul": float,
+    "yul": float,
+    "rotation": float,
+    "epsg": int,
+    "proj4": str,
+}
+
+
+def _parse_usgs_model_reference_file(reffile):
+    with open(reffile) as input:
+        lines = input.read().splitlines()
+
+    ref = {}
+    for line in lines:
+        line = line.lstrip()
+        if not line or line[0] == "#":
+            continue
+        info = line.partition("#")[0].split(None, 1)
+        if len(info) > 1:
+            cast = _USGS_REF_CASTER.get(info[0])
+            if cast is not None:
+                ref[info[0]] = cast(info[1].strip())
+    return ref
 
 
 class CachedData:
@@ -841,57 +870,19 @@ class Grid:
         # check for reference info in the nam file header
         if namefile is None:
             return False
-        xul, yul = None, None
-        header = []
-        with open(namefile, "r") as f:
-            for line in f:
-                if not line.startswith("#"):
-                    break
-                header.extend(line.strip().replace("#", "").split(";"))
-
-        for item in header:
-            if "xll" in item.lower():
-                try:
-                    xll = float(item.split(":")[1])
-                    self._xoff = xll
-                except:
-                    pass
-            elif "yll" in item.lower():
-                try:
-                    yll = float(item.split(":")[1])
-                    self._yoff = yll
-                except:
-                    pass
-            elif "xul" in item.lower():
-                try:
-                    xul = float(item.split(":")[1])
-                except:
-                    pass
-            elif "yul" in item.lower():
-                try:
-                    yul = float(item.split(":")[1])
-                except:
-                    pass
-            elif "rotation" in item.lower():
-                try:
-                    self._angrot = float(item.split(":")[1])
-                except:
-                    pass
-            elif "proj4_str" in item.lower():
-                try:
-                    self._proj4 = ":".join(item.split(":")[1:]).strip()
-                    if self._proj4.lower() == "none":
-                        self._proj4 = None
-                except:
-                    pass
-            elif "start" in item.lower():
-                try:
-                    start_datetime = item.split(":")[1].strip()
-                except:
-                    pass
+        attribs, _ = _read_namfile_header(namefile)
+        if "xll" in attribs:
+            self._xoff = attribs["xll"]
+        if "yll" in attribs:
+            self._yoff = attribs["yll"]
+        if "rotation" in attribs:
+            self._angrot = attribs["rotation"]
+        if "proj4_str" in attribs:
+            self._proj4 = attribs["proj4_str"]
 
         # we need to rotate the modelgrid first, then we can
         # calculate the xll and yll from xul and yul
+        xul, yul = attribs.get("xul"), attribs.get("yul")
         if (xul, yul) != (None, None):
             self.set_coord_info(
                 xoff=self._xul_to_xll(xul),
@@ -904,46 +895,34 @@ class Grid:
     def read_usgs_model_reference_file(self, reffile="usgs.model.reference"):
         """read spatial reference info from the usgs.model.reference file
         https://water.usgs.gov/ogw/policy/gw-model/modelers-setup.html"""
-        xul = None
-        yul = None
-        if os.path.exists(reffile):
-            with open(reffile) as input:
-                for line in input:
-                    if len(line) > 1:
-                        if line.strip()[0] != "#":
-                            info = line.strip().split("#")[0].split()
-                            if len(info) > 1:
-                                data = " ".join(info[1:])
-                                if info[0] == "xll":
-                                    self._xoff = float(data)
-                                elif info[0] == "yll":
-                                    self._yoff = float(data)
-                                elif info[0] == "xul":
-                                    xul = float(data)
-                                elif info[0] == "yul":
-                                    yul = float(data)
-                                elif info[0] == "rotation":
-                                    self._angrot = float(data)
-                                elif info[0] == "epsg":
-                                    self._epsg = int(data)
-                                elif info[0] == "proj4":
-                                    self._proj4 = data
-                                elif info[0] == "start_date":
-                                    start_datetime = data
-
-            # model must be rotated first, before setting xoff and yoff
-            # when xul and yul are provided.
-            if (xul, yul) != (None, None):
-                self.set_coord_info(
-                    xoff=self._xul_to_xll(xul),
-                    yoff=self._yul_to_yll(yul),
-                    angrot=self._angrot,
-                )
-
-            return True
-        else:
+        if not os.path.exists(reffile):
             return False
 
+        ref = _read_cached(reffile, _parse_usgs_model_reference_file)
+
+        if "xll" in ref:
+            self._xoff = ref["xll"]
+        if "yll" in ref:
+            self._yoff = ref["yll"]
+        if "rotation" in ref:
+            self._angrot = ref["rotation"]
+        if "epsg" in ref:
+            self._epsg = ref["epsg"]
+        if "proj4" in ref:
+            self._proj4 = ref["proj4"]
+
+        # model must be rotated first, before setting xoff and yoff
+        # when xul and yul are provided.
+        xul, yul = ref.get("xul"), ref.get("yul")
+        if (xul, yul) != (None, None):
+            self.set_coord_info(
+                xoff=self._xul_to_xll(xul),
+                yoff=self._yul_to_yll(yul),
+                angrot=self._angrot,
+            )
+
+        return True
+
     # Internal
     def _xul_to_xll(self, xul, angrot=None):
         yext = self.xyedges[1][0]
@@ -13,6 +13,15 @@ class ModelTime:
         contains start time and time units information
     """
 
+    __slots__ = (
+        "_period_data",
+        "_time_units",
+        "_start_datetime",
+        "_steady_state",
+        "_totim_cache",
+        "_tslen_cache",
+    )
+
     def __init__(
         self,
         period_data=None,
@@ -24,6 +33,8 @@ class ModelTime:
         self._time_units = time_units
         self._start_datetime = start_datetime
         self._steady_state = steady_state
+        self._totim_cache = None
+        self._tslen_cache = None
 
     @property
     def time_units(self):
@@ -33,9 +44,19 @@ class ModelTime:
     def start_datetime(self):
         return self._start_datetime
 
+    def _get_period_data_array(self, key, dtype):
+        # period data may be passed as lists or as arrays of another dtype;
+        # convert it once and keep the array so later accesses do not
+        # convert again
+        arr = self._period_data[key]
+        if not isinstance(arr, np.ndarray) or arr.dtype != dtype:
+            arr = np.asarray(arr, dtype=dtype)
+            self._period_data[key] = arr
+        return arr
+
     @property
     def perlen(self):
-        return self._period_data["perlen"]
+        return self._get_period_data_array("perlen", float)
 
     @property
     def nper(self):
@@ -43,49 +64,71 @@ class ModelTime:
 
     @property
     def nstp(self):
-        return self._period_data["nstp"]
+        return self._get_period_data_array("nstp", int)
 
     @property
     def tsmult(self):
-        return self._period_data["tsmult"]
+        return self._get_period_data_array("tsmult", float)
 
     @property
     def steady_state(self):
         return self._steady_state
 
+    def _cache_entry(self, data):
+        # the period data arrays are kept with the cached data, so they stay
+        # alive and are compared by identity, along with a copy of their
+        # values so that edits made in place are also detected
+        arrays = (self.perlen, self.nstp, self.tsmult)
+        return arrays, tuple(arr.copy() for arr in arrays), data
+
+    def _is_cache_valid(self, cache):
+        if cache is None:
+            return False
+        cached_arrays, cached_values, _ = cache
+        arrays = (self.perlen, self.nstp, self.tsmult)
+        return all(
+            arr is cached_arr and np.array_equal(arr, cached_value)
+            for arr, cached_arr, cached_value in zip(
+                arrays, cached_arrays, cached_values
+            )
+        )
+
     @property
     def totim(self):
-        delt = []
-        perlen_array = self.perlen
-        nstp_array = self.nstp
-        tsmult_array = self.tsmult
-        for ix, nstp in enumerate(nstp_array):
-            perlen = perlen_array[ix]
-            tsmult = tsmult_array[ix]
-            for stp in range(nstp):
-                if stp == 0:
-                    if tsmult != 1.0:
-                        dt = perlen * (tsmult - 1) / ((tsmult**nstp) - 1)
-                    else:
-                        dt = perlen / nstp
-                else:
-                    dt = delt[-1] * tsmult
-                delt.append(dt)
-
-        totim = np.add.accumulate(delt)
-        return totim
+        if self._is_cache_valid(self._totim_cache):
+            return self._totim_cache[-1].copy()
+
+        perlen = self.perlen
+        nstp = self.nstp
+        tsmult = self.tsmult
+
+        # length of the first time step in each stress period, from the
+        # closed form of the geometric series perlen = sum(dt0 * tsmult**k)
+        dt0 = perlen / nstp
+        geometric = tsmult != 1.0
+        dt0[geometric] = (
+            perlen[geometric]
+            * (tsmult[geometric] - 1.0)
+            / (tsmult[geometric] ** nstp[geometric] - 1.0)
+        )
+
+        # stress period and zero-based step number of every time step
+        kper = np.repeat(np.arange(len(nstp)), nstp)
+        kstp = np.arange(kper.size) - (np.cumsum(nstp) - nstp)[kper]
+
+        # time step lengths, accumulated in place into totim
+        totim = tsmult[kper] ** kstp
+        totim *= dt0[kper]
+        np.cumsum(totim, out=totim)
+        self._totim_cache = self._cache_entry(totim)
+        return totim.copy()
 
     @property
     def tslen(self):
-        n = 0
-        tslen = []
+        if self._is_cache_valid(self._tslen_cache):
+            return self._tslen_cache[-1].copy()
+
         totim = self.totim
-        for ix, stp in enumerate(self.nstp):
-            for i in range(stp):
-                if not tslen:
-                    tslen = [totim[n]]
-                else:
-                    tslen.append(totim[n] - totim[n - 1])
-                n += 1
-
-        return np.array(tslen)
+        tslen = np.ediff1d(totim, to_begin=totim[:1])
+        self._tslen_cache = self._cache_entry(tslen)
+        return tslen.copy()
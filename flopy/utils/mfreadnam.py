@@ -7,8 +7,24 @@ MODFLOW Guide
 <https://water.usgs.gov/ogw/modflow/MODFLOW-2005-Guide/name_file.html>`_.
 
 """
+import copy
+import os
+from functools import lru_cache
+from itertools import takewhile
 from pathlib import Path, PurePosixPath, PureWindowsPath
 
+# model attributes that can be read from the name file header
+_NAMFILE_CASTER = {
+    "xll": float,
+    "yll": float,
+    "xul": float,
+    "yul": float,
+    "rotation": float,
+    "proj4_str": str,
+    "start_datetime": str,
+}
+_NAMFILE_KEYS = frozenset(_NAMFILE_CASTER)
+
 
 class NamData:
     """
@@ -201,6 +217,58 @@ def parsenamefile(namfilename, packages, verbose=True):
     return ext_unit_dict
 
 
+def _read_cached(path, parse):
+    """Return parse(path), reusing the result while the file is unchanged.
+
+    A copy of the cached result is returned, so callers cannot modify it.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return copy.deepcopy(
+        _cached_parse(parse, path, stat.st_mtime_ns, stat.st_size)
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_parse(parse, path, mtime, size):
+    # the modification time and size are only part of the cache key, so
+    # that the file is parsed again after it has changed
+    return parse(path)
+
+
+def _read_namfile_header(namefile):
+    """Return the model attributes found in the name file header, and the
+    names of attributes whose values could not be parsed."""
+    return _read_cached(namefile, _parse_namfile_header)
+
+
+def _parse_namfile_header(namefile):
+    attribs = {}
+    unparsed = []
+    with open(namefile, "r") as f:
+        # the header is the block of comment lines at the top of the file
+        header = takewhile(lambda line: line.startswith("#"), f)
+        for line in header:
+            for item in line.lstrip("#").split(";"):
+                key, _, value = item.partition(":")
+                key = key.strip().lower()
+                cast = _NAMFILE_CASTER.get(key)
+                if cast is None:
+                    continue
+                try:
+                    value = cast(value.strip())
+                except ValueError:
+                    unparsed.append(key)
+                    continue
+                if isinstance(value, str) and value.lower() == "none":
+                    value = None
+                attribs[key] = value
+            # stop reading once every attribute has been found
+            if attribs.keys() >= _NAMFILE_KEYS:
+                break
+    return attribs, tuple(unparsed)
+
+
 def attribs_from_namfile_header(namefile):
     # check for reference info in the nam file header
     defaults = {
@@ -213,56 +281,8 @@ def attribs_from_namfile_header(namefile):
     }
     if namefile is None:
         return defaults
-    header = []
-    with open(namefile, "r") as f:
-        for line in f:
-            if not line.startswith("#"):
-                break
-            header.extend(line.strip().replace("#", "").split(";"))
-
-    for item in header:
-        if "xll" in item.lower():
-            try:
-                xll = float(item.split(":")[1])
-                defaults["xll"] = xll
-            except:
-                print(f"   could not parse xll in {namefile}")
-        elif "yll" in item.lower():
-            try:
-                yll = float(item.split(":")[1])
-                defaults["yll"] = yll
-            except:
-                print(f"   could not parse yll in {namefile}")
-        elif "xul" in item.lower():
-            try:
-                xul = float(item.split(":")[1])
-                defaults["xul"] = xul
-            except:
-                print(f"   could not parse xul in {namefile}")
-        elif "yul" in item.lower():
-            try:
-                yul = float(item.split(":")[1])
-                defaults["yul"] = yul
-            except:
-                print(f"   could not parse yul in {namefile}")
-        elif "rotation" in item.lower():
-            try:
-                angrot = float(item.split(":")[1])
-                defaults["rotation"] = angrot
-            except:
-                print(f"   could not parse rotation in {namefile}")
-        elif "proj4_str" in item.lower():
-            try:
-                proj4 = ":".join(item.split(":")[1:]).strip()
-                if proj4.lower() == "none":
-                    proj4 = None
-                defaults["proj4_str"] = proj4
-            except:
-                print(f"   could not parse proj4_str in {namefile}")
-        elif "start" in item.lower():
-            try:
-                start_datetime = item.split(":")[1].strip()
-                defaults["start_datetime"] = start_datetime
-            except:
-                print(f"   could not parse start in {namefile}")
+    attribs, unparsed = _read_namfile_header(namefile)
+    for key in unparsed:
+        print(f"   could not parse {key} in {namefile}")
+    defaults.update(attribs)
     return defaults
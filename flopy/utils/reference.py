@@ -12,6 +12,8 @@ class TemporalReference:
     outside of DIS package.
     """
 
+    __slots__ = ("itmuni", "start_datetime")
+
     defaults = {"itmuni": 4, "start_datetime": "01-01-1970"}
 
     itmuni_values = {